@@ -22,7 +22,7 @@ const gameConfig = {
 	// UI全体の倍率（1 = 基本サイズ）。これを変えるとスロット本体の大きさを一括で調整できます。
 	// 例: 1.2 は 120% サイズ、0.8 は 80% サイズ
 	uiScale: 1,
-	symbolDuplicationFactor: 2, // 無限スクロールを滑らかに見せるため、リール内のシンボルを何周分複製するか。値を大きくするとメモリ使用量が増えます。
+	symbolDuplicationFactor: 2, // 無限スクロールを滑らかに見せるため、リール内のシンボルを何周分複製するかの上限。2以上なら継ぎ目に必要な分（1周 + 表示行数）だけ生成します。1にすると継ぎ目で空白が見えます。
 
 	// --- リールのシンボル構成 ---
 	// 注意: 各リールに表示されるシンボルの配列です。
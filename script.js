@@ -4,6 +4,14 @@
  *        リールの生成、回転アニメーション、停止制御、ゲームモードの切り替えなどを担当します。
  */
 
+// --- 共通定数 ---------------------------------------------------------------
+/** 速度設定（px/フレーム）の基準となる1フレームの長さ (ms)。60fps 相当。 */
+const REFERENCE_FRAME_MS = 1000 / 60;
+/** 1回の描画で進める最大フレーム数。タブ復帰や処理落ち直後にリールが大きく飛ぶのを防ぎます。 */
+const MAX_FRAME_CATCHUP = 4;
+/** 停止結果テーブル（全停止位置の組み合わせ）を事前計算する上限サイズ。超える場合は都度計算します。 */
+const OUTCOME_TABLE_MAX_SIZE = 1 << 16;
+
 // --- 共通ユーティリティ（純粋関数群） --------------------------------------
 /** 数値を[min,max]にクランプ */
 function clamp(v, min, max) { return Math.min(Math.max(v, min), max); }
@@ -25,6 +33,38 @@ function weightedChoice(items) {
 	return valid[valid.length - 1].key;
 }
 
+// --- 共通ユーティリティ（副作用あり: ブラウザのタイマー・乱数状態を扱う） ---------------
+/**
+ * 急ぎでない処理をブラウザのアイドル時間に遅延実行します（requestIdleCallback が無ければ setTimeout）。
+ * @param {Function} fn - 実行する処理
+ * @param {number} [timeout=100] - アイドルにならなくても実行する最大待ち時間 (ms)
+ */
+function scheduleIdle(fn, timeout = 100) {
+	if (typeof requestIdleCallback === 'function') requestIdleCallback(() => fn(), { timeout });
+	else setTimeout(fn, 0);
+}
+
+/**
+ * 一様乱数 [0, 1) を返す関数を生成します。
+ * crypto.getRandomValues で batchSize 個ずつまとめて補充したバッファから順に払い出すため、
+ * 呼び出しごとの API 呼び出しコストを均せます。Web Crypto が無い環境では Math.random を返します。
+ * @param {number} [batchSize=256] - 1回の補充で生成する乱数の個数
+ * @returns {() => number}
+ */
+function createRandomSource(batchSize = 256) {
+	const cryptoObj = (typeof crypto !== 'undefined') ? crypto : null;
+	if (!cryptoObj || typeof cryptoObj.getRandomValues !== 'function') return Math.random;
+	const buf = new Uint32Array(batchSize);
+	let idx = batchSize; // 初回呼び出しで補充
+	return () => {
+		if (idx >= batchSize) {
+			cryptoObj.getRandomValues(buf);
+			idx = 0;
+		}
+		return buf[idx++] / 4294967296; // 2^32 で割って [0, 1) へ
+	};
+}
+
 /**
  * 設計概要 / アーキテクチャ
  * - 役割分担:
@@ -41,7 +81,8 @@ function weightedChoice(items) {
  *   2) セレクタ変更: HTML の id/class を変えたら config.selectors を必ず更新。null 参照に注意。
  *   3) reverseRotation: 停止計算の符号・正規化式が変わるため、変更時は実機確認を推奨します。
  *   4) reelsData順序: インデックス指定（symbolIndex）や演出位置に影響。テスト設定も合わせて見直し。
- *   5) 互換性: transform 取得は UIManager#getCurrentTranslateY を正典とし、重複実装を避けてください。
+ *   5) 互換性: transform の書き込みは SlotGame#renderReel、取得は SlotGame#getReelY に集約しています。
+ *      DOM からの読み戻しは UIManager#getCurrentTranslateY を正典とし、重複実装を避けてください。
  */
 
 /**
@@ -60,6 +101,7 @@ class UIManager {
 	constructor(config) {
 		this.config = config;
 		this.elements = {}; // 取得したDOM要素を格納するオブジェクト
+		this.symbolTemplates = new Map(); // シンボル文字列 -> 複製元となる div.symbol（初回生成時に作成）
 		this.getElements();
 	}
 
@@ -128,17 +170,19 @@ class UIManager {
 
 	/**
 	 * 個々のシンボル要素（div.symbol）を作成します。
+	 * シンボルごとの雛形を一度だけ組み立ててキャッシュし、以降は複製して返します。
 	 * @param {string} symbol - 表示するシンボルのテキスト
 	 * @returns {HTMLElement} 作成されたシンボル要素
 	 */
 	createSymbolElement(symbol) {
-		const symbolElement = document.createElement('div');
-		symbolElement.className = 'symbol';
-		symbolElement.textContent = symbol;
-		if (symbol === 'BAR') {
-			symbolElement.classList.add('bar');
+		let template = this.symbolTemplates.get(symbol);
+		if (!template) {
+			template = document.createElement('div');
+			template.className = (symbol === 'BAR') ? 'symbol bar' : 'symbol';
+			template.textContent = symbol;
+			this.symbolTemplates.set(symbol, template);
 		}
-		return symbolElement;
+		return template.cloneNode(true);
 	}
 
 	/**
@@ -200,10 +244,28 @@ class UIManager {
 	}
 }
 
+/** ページ内で共有する AudioContext（初回要求時に生成） */
+let sharedAudioContext = null;
+
+/**
+ * 共有 AudioContext を返します（未生成なら生成）。
+ * ブラウザは同時に持てる AudioContext 数に上限があり、生成ごとに音声スレッド等の資源を確保するため、
+ * SoundManager が複数作られても1つを使い回します。
+ * @returns {AudioContext}
+ */
+function getSharedAudioContext() {
+	if (!sharedAudioContext) {
+		sharedAudioContext = new (window.AudioContext || window.webkitAudioContext)();
+	}
+	return sharedAudioContext;
+}
+
 /**
  * SoundManager: WebAudio を使ってサウンドを管理します。
  * - 設定でファイルが指定されていれば fetch で読み込み再生
  * - 未指定時は簡易的な beep 合成で代替
+ * - AudioContext の生成とファイルのデコードは初回再生時まで遅延します（起動を軽くし、
+ *   ユーザー操作前に AudioContext を作って自動再生ポリシーに抑止されるのを避けるため）。
  */
 class SoundManager {
 	constructor(config) {
@@ -213,31 +275,49 @@ class SoundManager {
 		this.files = this.config.sounds?.files || {};
 		this.ctx = null;
 		this.buffers = {};
-		if (this.enabled) this._init();
+		this.loading = {}; // key -> 読み込み中/読み込み済みの Promise（重複 fetch 防止）
 	}
 
-	async _init() {
+	/**
+	 * AudioContext を必要になった時点で生成し、指定ファイルの読み込みを開始します。
+	 * @returns {boolean} 再生可能な状態なら true
+	 */
+	_ensureContext() {
+		if (!this.enabled) return false;
+		if (this.ctx) return true;
 		try {
-			this.ctx = new (window.AudioContext || window.webkitAudioContext)();
-			// 可能ならファイルをプリロード
-			for (const key of ['spinStart', 'reelStop', 'win']) {
-				const path = this.files[key];
-				if (path) {
-					try {
-						const res = await fetch(path);
-						const ab = await res.arrayBuffer();
-						const buf = await this.ctx.decodeAudioData(ab.slice(0));
-						this.buffers[key] = buf;
-					} catch (e) {
-						// 失敗しても合成でフォールバック
-						console.warn('Sound preload failed for', key, e);
-					}
-				}
-			}
+			this.ctx = getSharedAudioContext();
 		} catch (e) {
 			console.warn('WebAudio init failed, sound disabled', e);
 			this.enabled = false;
+			return false;
 		}
+		// 指定ファイルは初回だけ読み込む（読み込み完了までは合成音でフォールバック）
+		for (const key of ['spinStart', 'reelStop', 'win']) this._loadBuffer(key);
+		return true;
+	}
+
+	/**
+	 * 指定キーのサウンドファイルを読み込み、デコード結果を this.buffers に格納します。
+	 * @param {string} key - 'spinStart' | 'reelStop' | 'win'
+	 * @returns {Promise<void>|null} ファイル未指定の場合は null
+	 */
+	_loadBuffer(key) {
+		const path = this.files[key];
+		if (!path || !this.ctx) return null;
+		if (!this.loading[key]) {
+			this.loading[key] = (async () => {
+				try {
+					const res = await fetch(path);
+					const ab = await res.arrayBuffer();
+					this.buffers[key] = await this.ctx.decodeAudioData(ab.slice(0));
+				} catch (e) {
+					// 失敗しても合成でフォールバック
+					console.warn('Sound preload failed for', key, e);
+				}
+			})();
+		}
+		return this.loading[key];
 	}
 
 	_playBuffer(buf) {
@@ -251,14 +331,14 @@ class SoundManager {
 	}
 
 	playSpinStart() {
-		if (!this.enabled) return;
+		if (!this._ensureContext()) return;
 		if (this.buffers.spinStart) return this._playBuffer(this.buffers.spinStart);
 		// 合成: 低周波の短いノイズ的なサウンド
 		this._synthBeep(120, 0.12, 'sine');
 	}
 
 	playReelStop() {
-		if (!this.enabled) return;
+		if (!this._ensureContext()) return;
 		if (this.buffers.reelStop) return this._playBuffer(this.buffers.reelStop);
 		// 停止音は目立たせるため、ループ音より大きめに再生する
 		const vol = Math.min(1.0, this.volume * 1.6);
@@ -266,7 +346,7 @@ class SoundManager {
 	}
 
 	playWin() {
-		if (!this.enabled) return;
+		if (!this._ensureContext()) return;
 		if (this.buffers.win) return this._playBuffer(this.buffers.win);
 		// 合成: 上昇トーンのメロディ風
 		this._synthSequence([600, 900, 1200], 0.12);
@@ -311,7 +391,7 @@ class SoundManager {
 
 	// 回転中のループ音（ピコピコ音）を開始（短いビープを間欠的に鳴らす方式）
 	loopStart() {
-		if (!this.enabled || !this.ctx) return;
+		if (!this._ensureContext()) return;
 		if (this._loopTimer) return; // 既にループ中
 		// 周期的に短いビープを鳴らす。フェーズパターンを用いて段階的な音にする。
 		const pattern = [880, 740, 660, 740];
@@ -360,6 +440,8 @@ class SlotGame {
 
 		// グローバル参照を設定して UIManager から委譲できるようにする
 		try { window.activeSlotGame = this; } catch (e) { /* ignore */ }
+		// 抽選・停止タイミングのゆらぎ等に使う乱数源（バッファ補充式）
+		this.random = createRandomSource();
 		// サウンドマネージャを初期化（設定に基づく）
 		this.soundManager = new SoundManager(this.config);
 
@@ -412,6 +494,8 @@ class SlotGame {
 		this.isSpinning = false;     // ゲーム全体が現在回転中であるかを示すフラグ (true: 回転中, false: 停止中)
 		this.isAutoMode = config.initialIsAutoMode;      // 現在のゲームモード (true: 自動停止モード, false: 目押しモード)
 		this.manualStopCount = 0;    // 目押しモード時に、プレイヤーが停止させたリールの数をカウント
+		this.frameId = null;         // 共通フレームループの requestAnimationFrame ID（未予約なら null）
+		this.activeReels = [];       // tick を持つ（アニメーション中の）リールのみを保持。フレームループはこれだけを走査
 
 		// ゲームの初期化処理を開始
 		this.init();
@@ -427,13 +511,18 @@ class SlotGame {
 		this.bindEvents();          // ボタンクリックなどのイベントを登録
 		this.initLever();           // レバー初期化（右側レバーの押下演出と連動）
 		// 勝利メッセージ要素を作成して body に追加（存在しない場合）
-		if (!document.getElementById('winMessage')) {
-			const wm = document.createElement('div');
+		let wm = document.getElementById('winMessage');
+		if (!wm) {
+			wm = document.createElement('div');
 			wm.id = 'winMessage';
 			wm.innerHTML = `<span class="amount"></span><span class="sub">おめでとうございます!</span>`;
 			// スロットコンテナ中央に重ねるため、コンテナ配下へ配置
 			(this.slotContainer || document.body).appendChild(wm);
 		}
+		// 表示のたびに DOM を探索しないよう参照を保持（以降は金額テキストと show クラスのみ更新）
+		this.winMessageEl = wm;
+		this.winMessageAmountEl = wm.querySelector('.amount');
+		this.winMessageShown = false; // 表示中かどうか（非表示時の無駄な DOM 更新を避ける）
 
 		// コントロール領域にエクスポート/インポートUIを追加
 		const controls = document.querySelector('.controls');
@@ -472,6 +561,9 @@ class SlotGame {
 			wrap.appendChild(imp);
 			controls.appendChild(wrap);
 		}
+		// 停止結果テーブルは初回の判定時に構築されるため、最後のリールの停止フレームで構築されないよう
+		// 起動後のアイドル時間に先行して作っておく
+		scheduleIdle(() => this.getOutcomeTable(), 1000);
 		// 配当表をレンダリング
 		this.renderPayoutTable();
 		// 賭け金入力の自動サイズ調整を初期化
@@ -540,22 +632,36 @@ class SlotGame {
 	 * - 期待値は「1ベットあたりの期待配当倍率」を計算します（配当はラインごとに加算される現在の仕様に準拠）。
 	 * - 計算は現行のリールシンボル分布（reelsData）と this.payoutTable を用いて行います。
 	 * - 表示はトグルで開閉可能。開発中に自由に表示/非表示できます。
+	 * - 計算結果は掛け金に依存しないため、初回計算後はキャッシュを返します（賭け金入力のたびに再計算しない）。
+	 *   reelsData / payoutTable / 演出確率を実行中に変更した場合は invalidateStatsCache() を呼んでください
+	 *   （開発者パネルの「更新」ボタンはキャッシュを破棄してから再計算します）。
 	 */
 
-	computeExpectedValuePerUnit() {
-		// 各リールごとのシンボル確率を算出（固定停止位置が一様であるという前提）
-		const perReelProb = this.getPerReelSymbolProbs();
+	/**
+	 * 期待値・確率計算、抽選テーブル、停止結果テーブルのキャッシュを破棄します。
+	 * シンボルID で引く配当倍率表（payoutById）もここで payoutTable から作り直します。
+	 */
+	invalidateStatsCache() {
+		if (this.symbolList) {
+			// シンボルID -> 配当倍率（payoutTable に無いシンボルは 0）
+			this.payoutById = Float64Array.from(this.symbolList, sym => Number(this.payoutTable[sym]) || 0);
+		}
+		this._perReelProbCache = null;
+		this._evCache = null;
+		this._probReturnCache = null;
+		this._winSymbolSampler = null;
+		this._outcomeTable = null;
+	}
 
+	computeExpectedValuePerUnit() {
+		if (this._evCache) return this._evCache;
 		// ラインあたりの期待倍率 = sum_over_symbols( product_over_reels P_r(symbol) * multiplier(symbol) )
-		const symbols = Object.keys(this.payoutTable);
+		// シンボルID で並んだ配列同士の内積として計算する
+		const lineHitProbs = this.getLineHitProbsById();
+		const payoutById = this.payoutById;
 		let perLineExpectedMult = 0;
-		for (const sym of symbols) {
-			let p = 1;
-			for (let i = 0; i < this.reels.length; i++) {
-				p *= (perReelProb[i][sym] || 0);
-			}
-			const mult = Number(this.payoutTable[sym] || 0);
-			perLineExpectedMult += p * mult;
+		for (let id = 0; id < lineHitProbs.length; id++) {
+			perLineExpectedMult += lineHitProbs[id] * payoutById[id];
 		}
 
 		// ライン数（定義から算出）
@@ -587,7 +693,8 @@ class SlotGame {
 		// EV_total_per_unit = (1 - sumP) * evNaturalPerUnit + horizP * forcedExpectedMult + diagP * forcedExpectedMult
 		const evTotalPerUnit = (1 - sumP) * evNaturalPerUnit + (horizP + diagP) * forcedExpectedMult;
 
-		return { evPerUnit: evTotalPerUnit, evNaturalPerUnit, forcedExpectedMult, perLineExpectedMult, totalLines, horizP, diagP };
+		this._evCache = { evPerUnit: evTotalPerUnit, evNaturalPerUnit, forcedExpectedMult, perLineExpectedMult, totalLines, horizP, diagP };
+		return this._evCache;
 	}
 
 	/**
@@ -595,16 +702,14 @@ class SlotGame {
 	 * 単純化モデル: ライン間独立、forced 演出は1ラインを置換する近似
 	 */
 	computeProbabilityReturnGreaterThanBet(bet) {
+		// 倍率ベースの計算なので結果は bet に依らない（キャッシュ可能）
+		if (typeof this._probReturnCache === 'number') return this._probReturnCache;
 		// ライン毎の倍率PMF を作る
-		const symbols = Object.keys(this.payoutTable);
-		const perReelProb = this.getPerReelSymbolProbs();
-
+		const lineHitProbs = this.getLineHitProbsById();
 		const linePMF = new Map();
-		for (const sym of symbols) {
-			let p = 1;
-			for (let i = 0; i < this.reels.length; i++) p *= (perReelProb[i][sym] || 0);
-			const mult = Number(this.payoutTable[sym] || 0);
-			linePMF.set(mult, (linePMF.get(mult) || 0) + p);
+		for (let id = 0; id < lineHitProbs.length; id++) {
+			const mult = this.payoutById[id];
+			linePMF.set(mult, (linePMF.get(mult) || 0) + lineHitProbs[id]);
 		}
 		const sumProb = Array.from(linePMF.values()).reduce((s, v) => s + v, 0);
 		if (sumProb < 0.999999) linePMF.set(0, (linePMF.get(0) || 0) + (1 - sumProb));
@@ -646,6 +751,7 @@ class SlotGame {
 		for (const [m, p] of finalPMF.entries()) {
 			if (m > 1 - 1e-12) prob += p;
 		}
+		this._probReturnCache = prob;
 		return prob;
 	}
 
@@ -706,64 +812,87 @@ class SlotGame {
 		const evForBet = ev.evPerUnit * bet;
 		const roi = (ev.evPerUnit - 1) * 100; // % return over bet (approx)
 
-		content.innerHTML = '';
+		// 行ごとにライブ DOM へ追加すると挿入のたびにレイアウトが無効化されるため、
+		// DocumentFragment に組み立ててから1回で差し替える
+		const frag = document.createDocumentFragment();
 
 		const title = document.createElement('div');
 		title.style.fontWeight = '600';
 		title.style.marginBottom = '6px';
 		title.textContent = '期待値内訳（1ベットあたり）';
-		content.appendChild(title);
+		frag.appendChild(title);
 
 		const total = document.createElement('div');
 		total.textContent = `合計期待倍率（1ベットあたり）: ${ev.evPerUnit.toFixed(6)}`;
-		content.appendChild(total);
+		frag.appendChild(total);
 
 		const natural = document.createElement('div');
 		natural.textContent = `自然発生期待倍率（全ライン合算）: ${ev.evNaturalPerUnit.toFixed(6)}`;
-		content.appendChild(natural);
+		frag.appendChild(natural);
 
 		const forced = document.createElement('div');
 		forced.textContent = `演出時の期待倍率（1行あたり）: ${ev.forcedExpectedMult.toFixed(4)}`;
-		content.appendChild(forced);
+		frag.appendChild(forced);
 
 		const probs = document.createElement('div');
 		probs.textContent = `演出確率: 合計=${(ev.horizP + ev.diagP).toFixed(4)} (水平:${ev.horizP.toFixed(3)}, 斜め:${ev.diagP.toFixed(3)})`;
-		content.appendChild(probs);
+		frag.appendChild(probs);
 
 		const lines = document.createElement('div');
 		lines.textContent = `考慮されたライン数: ${ev.totalLines} (ラインごとの自然期待倍率: ${ev.perLineExpectedMult.toFixed(6)})`;
-		content.appendChild(lines);
+		frag.appendChild(lines);
 
 		const evBetLine = document.createElement('div');
 		evBetLine.style.marginTop = '6px';
 		evBetLine.textContent = `現在の掛け金 (${bet}) に対する期待返還: ${evForBet.toFixed(2)}`;
-		content.appendChild(evBetLine);
+		frag.appendChild(evBetLine);
 
 		const roiLine = document.createElement('div');
 		roiLine.textContent = `概算 ROI: ${roi.toFixed(2)}%`;
-		content.appendChild(roiLine);
+		frag.appendChild(roiLine);
 
 		// 掛け金より多く返ってくる確率（近似）を表示
 		const prob = this.computeProbabilityReturnGreaterThanBet(bet);
 		const probLine = document.createElement('div');
 		probLine.style.marginTop = '6px';
 		probLine.textContent = `Prob(return > bet): ${(prob * 100).toFixed(2)}%`;
-		content.appendChild(probLine);
+		frag.appendChild(probLine);
 
 		const refresh = document.createElement('button');
 		refresh.textContent = '更新';
 		refresh.style.marginTop = '8px';
-		refresh.addEventListener('click', () => this.updateDevPanel());
-		content.appendChild(refresh);
+		// 実行中に gameConfig を編集した場合に備え、キャッシュを破棄してから再計算する
+		refresh.addEventListener('click', () => {
+			this.invalidateStatsCache();
+			this.updateDevPanel();
+		});
+		frag.appendChild(refresh);
+
+		content.replaceChildren(frag);
 	}
 
 	/**
 	 * HTML内にリール要素とシンボルを動的に生成し、配置します。
-	 * 無限スクロールを実現するため、シンボルリストは2周分生成されます。
+	 * 無限スクロールを実現するため、1周分のシンボルに続けて継ぎ目用の先頭シンボル（表示行数分）を生成します。
+	 * 表示位置は常に [-1周分の高さ, 0] に正規化されるため、それ以上の複製は画面に映らず DOM と描画レイヤーを肥大させるだけです。
 	 */
 	buildReels() {
 		this.ui.clearSlotContainer(); // 既存のリールがあればクリア
 
+		// シンボル文字列 <-> 整数ID の対応表。判定処理は文字列比較・文字列キー参照ではなく ID で行います。
+		// 文字列は表示・ログ・payoutTable のキーとしてのみ使用します。
+		this.symbolIds = new Map(); // symbol -> id
+		this.symbolList = [];       // id -> symbol
+		const idOf = (symbol) => {
+			let id = this.symbolIds.get(symbol);
+			if (id === undefined) {
+				id = this.symbolList.length;
+				this.symbolIds.set(symbol, id);
+				this.symbolList.push(symbol);
+			}
+			return id;
+		};
+
 		for (let i = 0; i < this.config.reelCount; i++) {
 			// 各リールを構成するHTML要素を作成
 			const reelElement = this.ui.createReelElement();
@@ -772,10 +901,14 @@ class SlotGame {
 			// 設定データから現在のリールに表示するシンボル配列を取得
 			const reelSymbols = this.config.reelsData[i];
 			const fragment = document.createDocumentFragment(); // DOM操作のパフォーマンス向上のためDocumentFragmentを使用
-			// 注意: symbolDuplicationFactor を増やすと初期 DOM ノード数とメモリ使用量が増加します。体感と性能のバランスで調整。
-
-			// シンボルを2周分生成し、リールに追加
-			for (let j = 0; j < reelSymbols.length * this.config.symbolDuplicationFactor; j++) {
+			// 注意: symbolDuplicationFactor は複製数の上限として扱い、継ぎ目に必要な分（1周 + 表示行数）を超えては生成しません。
+
+			// 1周分 + 継ぎ目用の表示行数分のシンボルを生成し、リールに追加
+			const nodeCount = Math.min(
+				reelSymbols.length * this.config.symbolDuplicationFactor,
+				reelSymbols.length + this.ROW_NAMES.length
+			);
+			for (let j = 0; j < nodeCount; j++) {
 				const symbol = reelSymbols[j % reelSymbols.length]; // シンボル配列をループ
 				const symbolElement = this.ui.createSymbolElement(symbol);
 				fragment.appendChild(symbolElement);
@@ -785,15 +918,36 @@ class SlotGame {
 			reelElement.appendChild(symbolsElement);
 			this.ui.appendReelToSlotContainer(reelElement);
 
+			// 停止位置（top インデックス）ごとの表示窓 [top, middle, bottom] のシンボルIDを事前計算
+			// 判定時の剰余計算・インデックス計算を省くためのテーブルです（reelsData は構築後に変化しない前提）。
+			// レイアウト: windowIds[topIndex * rowCount + rowIndex]
+			const rowCount = this.ROW_NAMES.length;
+			const len = reelSymbols.length;
+			const symbolIds = Uint16Array.from(reelSymbols, idOf);
+			const windowIds = new Uint16Array(len * rowCount);
+			for (let top = 0; top < len; top++) {
+				for (let row = 0; row < rowCount; row++) {
+					windowIds[top * rowCount + row] = symbolIds[(top + row) % len];
+				}
+			}
+
 			// 生成したリール要素と関連データを内部管理用の配列に格納
 			this.reels.push({
 				element: symbolsElement, // シンボルコンテナのDOM要素
 				symbols: reelSymbols,    // このリールに表示されるシンボルデータ
+				symbolIds,               // symbols と同順のシンボルID列
+				windowIds,               // 停止位置ごとの表示シンボルID（上記レイアウト）
 				spinning: false,         // このリールが回転中かどうかのフラグ
-				animationFrameId: null,  // requestAnimationFrameのID (アニメーション停止時に使用)
-				totalHeight: reelSymbols.length * this.config.symbolHeight // シンボル2周分の全高
+				tick: null,              // 回転/停止アニメーションの毎フレーム更新関数（共通フレームループから呼ばれる。静止時は null）
+				stopping: false,         // 停止アニメーション中かどうかのフラグ
+				renderedY: null,         // 直近で DOM に書き込んだ translateY 値 (px)。同値の再書き込みを省くために使用
+				totalHeight: reelSymbols.length * this.config.symbolHeight // シンボル1周分の高さ（位置の正規化に使用）
 			});
 		}
+
+		// シンボルIDを振り直したため、ID で引くキャッシュ（確率・停止結果テーブル等）を全て破棄し、
+		// payoutById を新しい ID で作り直す
+		this.invalidateStatsCache();
 	}
 
 	/**
@@ -807,16 +961,40 @@ class SlotGame {
 			// 設定された初期位置が不正な場合のバリデーション
 			if (positionIndex < 0 || positionIndex >= reel.symbols.length) {
 				console.error(`リール${index}の初期位置(${positionIndex})が無効です。0に設定します。`);
-				this.ui.setReelTransform(reel.element, 0); // 安全なデフォルト値
+				this.renderReel(reel, 0); // 安全なデフォルト値
 				return;
 			}
 			// 指定されたシンボルがリールの一番上に表示されるようにY座標を計算
 			// 例: positionIndexが0なら0px、1なら-80px (シンボル1つ分上に移動)
 			const yPosition = -positionIndex * this.config.symbolHeight;
-			this.ui.setReelTransform(reel.element, yPosition);
+			this.renderReel(reel, yPosition);
 		});
 	}
 
+	/**
+	 * リールの表示位置を DOM に反映します。
+	 * 前回書き込んだ値と同じ場合は style を触らず、不要なスタイル再計算を避けます。
+	 * @param {object} reel - this.reels の要素
+	 * @param {number} yPosition - 設定するY軸の位置（ピクセル単位）
+	 */
+	renderReel(reel, yPosition) {
+		if (reel.renderedY === yPosition) return; // 変化なし: 書き込み不要
+		reel.renderedY = yPosition;
+		this.ui.setReelTransform(reel.element, yPosition);
+	}
+
+	/**
+	 * リールの現在の表示位置を返します。
+	 * 位置の書き込みは全て renderReel 経由のため、その記録値を正とし、getComputedStyle による
+	 * 読み戻し（回転中に呼ぶとスタイル再計算を強制する）は未描画時のフォールバックに限定します。
+	 * @param {object} reel - this.reels の要素
+	 * @returns {number} Y軸の変位量 (ピクセル単位)
+	 */
+	getReelY(reel) {
+		if (reel.renderedY !== null) return reel.renderedY;
+		return this.ui.getCurrentTranslateY(reel.element);
+	}
+
 	/*
 	 * 未使用のためコメントアウト：
 	 * SlotGame#getCurrentTranslateY は UIManager#getCurrentTranslateY と処理が重複しており、
@@ -991,6 +1169,9 @@ class SlotGame {
 		this.currentBet = bet; // ラウンドごとの賭け金を保持
 		this.updateBalanceUI();
 
+		// 前回の結果表示を片付ける（スタート操作の応答を優先して遅延実行）
+		this.clearLastResult();
+
 		// サウンド: スピン開始
 		try { this.soundManager?.playSpinStart(); } catch (e) { /* ignore */ }
 
@@ -1011,7 +1192,7 @@ class SlotGame {
 			const targets = this.config.stopTargets || [];
 			// 同時ターゲット制御の発動確率（スピン単位で一括適用）
 			const activationP = (typeof this.config.targetActivationProbability === 'number') ? this.config.targetActivationProbability : 1;
-			const useTargetsThisSpin = targets.length > 0 && Math.random() < activationP;
+			const useTargetsThisSpin = targets.length > 0 && this.random() < activationP;
 
 			let scheduled;
 			const hasMinMax = typeof this.config.autoStopMinTime === 'number' && typeof this.config.autoStopMaxTime === 'number';
@@ -1027,7 +1208,7 @@ class SlotGame {
 
 				scheduled = Array.from({ length: count }, (_v, i) => {
 					const base = minT + step * i;
-					const jitter = (Math.random() * derivedRand * 2) - derivedRand; // [-derivedRand, +derivedRand]
+					const jitter = (this.random() * derivedRand * 2) - derivedRand; // [-derivedRand, +derivedRand]
 					return { i, time: base + jitter };
 				});
 
@@ -1094,7 +1275,7 @@ class SlotGame {
 			const sumP = Math.min(1, Math.max(0, horizP + diagP));
 			let winType = null; // 'horizontal' | 'diagonal' | null
 
-			const roll = Math.random();
+			const roll = this.random();
 			if (roll < sumP) {
 				// horizontal を優先的に判定（horizP の範囲に収まれば horizontal、そうでなければ diagonal）
 				winType = (roll < Math.min(1, horizP)) ? 'horizontal' : 'diagonal';
@@ -1111,7 +1292,7 @@ class SlotGame {
 					if (winType === 'horizontal') {
 						const rows = this.ROW_NAMES;
 						const rowMode = this.config.winRowMode;
-						const row = rows.includes(rowMode) ? rowMode : rows[Math.floor(Math.random() * rows.length)];
+						const row = rows.includes(rowMode) ? rowMode : rows[Math.floor(this.random() * rows.length)];
 						spinTargets = this.reels.map((_r, idx) => ({ reelIndex: idx, symbol: chosenSymbol, position: row }));
 					} else if (winType === 'diagonal') {
 						// 3リール想定の斜め: ↘ (top,middle,bottom) or ↗ (bottom,middle,top)
@@ -1120,7 +1301,7 @@ class SlotGame {
 						if (mode === 'up' || mode === 'down') {
 							dir = mode;
 						} else {
-							dir = Math.random() < 0.5 ? 'down' : 'up';
+							dir = this.random() < 0.5 ? 'down' : 'up';
 						}
 						let positions;
 						if (this.config.reelCount === 3) {
@@ -1129,7 +1310,7 @@ class SlotGame {
 						} else {
 							// reelCount != 3 の場合は水平にフォールバック
 							const rows = this.ROW_NAMES;
-							const row = rows[Math.floor(Math.random() * rows.length)];
+							const row = rows[Math.floor(this.random() * rows.length)];
 							spinTargets = this.reels.map((_r, idx) => ({ reelIndex: idx, symbol: chosenSymbol, position: row }));
 						}
 					}
@@ -1153,8 +1334,10 @@ class SlotGame {
 	/**
 	 * 指定されたリールを回転させるアニメーションを開始します。
 	 * `requestAnimationFrame`と`transform: translateY()`を使用して滑らかな動きを実現します。
+	 * 移動量は実測のフレーム間隔で補正するため、ディスプレイのリフレッシュレートや処理落ちに関わらず
+	 * 体感速度は一定（60fps 換算の speed）になります。
 	 * @param {number} index - 回転を開始するリールのインデックス番号
-	 * @param {number} speed - リールの回転速度 (ピクセル/フレーム)
+	 * @param {number} speed - リールの回転速度 (ピクセル/フレーム、60fps 換算)
 	 */
 	startReel(index, speed) {
 		const reel = this.reels[index];
@@ -1163,39 +1346,85 @@ class SlotGame {
 
 		// 現在のY座標を取得し、回転方向に応じて内部的な位置`pos`を初期化
 		// `pos`は、リールの全高を考慮した無限スクロールのための仮想的な位置です。
-		const currentY = this.ui.getCurrentTranslateY(reel.element);
+		const currentY = this.getReelY(reel);
 		let pos = this.config.reverseRotation ? (currentY + reel.totalHeight) : -currentY;
 
 		const startTime = performance.now(); // アニメーション開始時刻を記録
+		let lastTime = startTime;            // 直前フレームの時刻（フレーム間隔の実測に使用）
 
-		// アニメーションループ関数
-		const animate = (currentTime) => {
-			if (!reel.spinning) return; // 停止命令が出ていればアニメーションを終了
+		// 毎フレーム参照する値は回転中に変化しないため、ここで一度だけ取り出しておく
+		const accelerationTime = this.config.accelerationTime;
+		const reverseRotation = this.config.reverseRotation;
+		const totalHeight = reel.totalHeight;
+		const easeIn = this.easeInCubic;
 
+		// 1フレーム分の更新関数（共通フレームループ runFrame から呼ばれる）
+		this.setReelTick(reel, (currentTime) => {
 			const elapsed = currentTime - startTime; // アニメーション開始からの経過時間
+			// 前フレームからの経過を 60fps 換算のフレーム数に変換（上限付き）
+			const frameScale = clamp((currentTime - lastTime) / REFERENCE_FRAME_MS, 0, MAX_FRAME_CATCHUP);
+			lastTime = currentTime;
 			let currentSpeed; // 現在のフレームでの速度
 
 			// 加速処理: 設定された加速時間内で徐々に速度を上げる
-			if (elapsed < this.config.accelerationTime) {
-				const progress = elapsed / this.config.accelerationTime; // 加速の進行度 (0.0 - 1.0)
-				currentSpeed = speed * this.easeInCubic(progress); // イージング関数で滑らかな加速を適用
+			if (elapsed < accelerationTime) {
+				const progress = elapsed / accelerationTime; // 加速の進行度 (0.0 - 1.0)
+				currentSpeed = speed * easeIn(progress); // イージング関数で滑らかな加速を適用
 			} else {
 				currentSpeed = speed; // 最高速度に到達
 			}
 
 			// `pos`を更新し、リールの全高を超えたらループさせる (無限スクロールの錯覚)
-			// 補足: totalHeight は重複分を含む 2 周（または指定周）相当です。mod により継ぎ目を不可視化します。
-			pos = (pos + currentSpeed) % reel.totalHeight;
+			// 補足: totalHeight は1周分の高さです。mod により継ぎ目を不可視化します（継ぎ目の先は複製ノードが表示）。
+			pos = (pos + currentSpeed * frameScale) % totalHeight;
 
 			// `pos`から実際のY座標`newY`を計算し、`transform: translateY()`に適用
 			// 回転方向によって計算方法が異なります。
-			const newY = this.config.reverseRotation ? (pos - reel.totalHeight) : -pos;
-			reel.element.style.transform = `translateY(${newY}px)`;
+			const newY = reverseRotation ? (pos - totalHeight) : -pos;
+			this.renderReel(reel, newY);
+		});
+	}
 
-			// 次のフレームで再度animate関数を呼び出す
-			reel.animationFrameId = requestAnimationFrame(animate);
-		};
-		requestAnimationFrame(animate); // アニメーションを開始
+	/**
+	 * リールの毎フレーム更新関数を登録/解除し、アクティブリール一覧を同期します。
+	 * 登録時は共通フレームループを予約します（既に予約済みなら相乗り）。
+	 * @param {object} reel - this.reels の要素
+	 * @param {Function|null} tick - 毎フレーム呼ぶ関数。null で解除
+	 */
+	setReelTick(reel, tick) {
+		reel.tick = tick;
+		const i = this.activeReels.indexOf(reel);
+		if (tick) {
+			if (i === -1) this.activeReels.push(reel);
+			this.requestFrame();
+		} else if (i !== -1) {
+			this.activeReels.splice(i, 1);
+		}
+	}
+
+	/**
+	 * 共通フレームループを次の描画フレームに予約します（予約済みなら何もしない）。
+	 * リールごとに requestAnimationFrame を回すと1フレームに複数のコールバックと DOM 書き込みが
+	 * 散らばるため、1回のコールバックで全リールの更新をまとめて行います。
+	 */
+	requestFrame() {
+		if (this.frameId !== null) return;
+		this.frameId = requestAnimationFrame((currentTime) => this.runFrame(currentTime));
+	}
+
+	/**
+	 * 共通フレームループ本体。アクティブなリールの tick だけを順に呼び、続きがあれば次フレームを予約します。
+	 * 予約は常に高々1つで、全リールが静止したら再予約しないため、待機中にコールバックが積み上がりません。
+	 * @param {number} currentTime - requestAnimationFrame から渡されるタイムスタンプ
+	 */
+	runFrame(currentTime) {
+		this.frameId = null;
+		const active = this.activeReels;
+		// 停止完了した tick は自身を一覧から外すため、後ろから走査して取りこぼしを防ぐ
+		for (let i = active.length - 1; i >= 0; i--) {
+			active[i].tick(currentTime);
+		}
+		if (active.length > 0) this.requestFrame();
 	}
 
 	/**
@@ -1207,10 +1436,12 @@ class SlotGame {
 	stopReel(index, target = null) {
 		const reel = this.reels[index];
 		if (!reel.spinning) return; // 既に停止している場合は何もしない
+		// 停止アニメーション中の再要求は無視（二重の停止アニメーションが同じリールを奪い合うのを防ぐ）
+		if (reel.stopping) return;
 
-		cancelAnimationFrame(reel.animationFrameId); // 回転アニメーションをキャンセル
+		this.setReelTick(reel, null); // 回転アニメーションを共通フレームループから外す
 
-		const currentY = this.ui.getCurrentTranslateY(reel.element); // 現在のY座標を取得
+		const currentY = this.getReelY(reel); // 現在のY座標を取得
 
 		let targetY;
 		let duration;
@@ -1225,22 +1456,22 @@ class SlotGame {
 			 * - 将来の編集で狂いやすい点:
 			 *   1) pickForwardClosestY のループ判定を壊すと無限ループや誤ったオフセットが発生します。
 			 *   2) 正規化式（mod -> -totalHeight）を変更すると表示が半周ずれるため慎重に。
-			 *   3) reel.totalHeight とここで計算する totalHeight を混在させると整合性が崩れる可能性があるため、
-			 *      どちらかに統一することを推奨します（本実装は既存プロパティを優先）。
+			 *   3) reel.totalHeight とここで計算する totalHeight はどちらも1周分の高さで同値ですが、
+			 *      将来どちらかの定義を変える場合に備え、どちらかに統一することを推奨します（本実装は既存プロパティを優先）。
 			 */
 
 			const reelSymbols = reel.symbols;
 			const symbolHeight = this.config.symbolHeight;
-			// ※ totalHeight は「1周分の高さ」を示す（reel.totalHeight は2周分を保持している呼び出し側もある）。
-			//    ここでは明示的に算出しているが、以降の計算では既存の reel.totalHeight を参照している箇所があるため
-			//    将来編集する場合はどちらを正とするか統一して下さい。
+			// ※ totalHeight は「1周分の高さ」を示し、reel.totalHeight と常に同じ値です（DOM 上のシンボル列は
+			//    1周 + 表示行数分ですが、位置は常に1周分の範囲へ正規化するため、2周分の高さを扱う箇所はありません）。
+			//    以降の計算では reel.totalHeight を参照している箇所もあるため、編集時はどちらかに統一して下さい。
 			const totalHeight = reelSymbols.length * symbolHeight;
 
 			// position の意味: top=表示上端にシンボルの先頭、middle=1つ下、bottom=2つ下に該当するようにオフセットを設ける
 			const validPositions = ['top', 'middle', 'bottom'];
 			let chosenPosition = validPositions.includes(target.position)
 				? target.position
-				: validPositions[Math.floor(Math.random() * validPositions.length)];
+				: validPositions[Math.floor(this.random() * validPositions.length)];
 			let positionOffset = 0;
 			if (chosenPosition === 'middle') positionOffset = 1;
 			if (chosenPosition === 'bottom') positionOffset = 2;
@@ -1397,29 +1628,34 @@ class SlotGame {
 			}
 			const startY = currentY;
 			const startTime = performance.now();
+			// イージング関数とログ設定はフレームごとに引き直さない
+			const easeOut = this.getStopEasingFn();
+			const frameLogs = Boolean(this.config.debug?.frameLogs);
 
+			// 停止アニメーションも共通フレームループ上で進める（リールごとの rAF 連鎖を作らない）
 			const animateStop = (currentTime) => {
 				const elapsed = currentTime - startTime;
-				const progress = Math.min(elapsed / duration, 1);
-				const easedProgress = this.getStopEasingFn()(progress);
+				// rAF のタイムスタンプは startTime より僅かに前になり得るため 0 未満も切り詰める
+				const progress = clamp(elapsed / duration, 0, 1);
+				const easedProgress = easeOut(progress);
 
 				// 仮想座標上の進行（前方に単調増加/減少）
 				const virtualY = startY + (animTargetY - startY) * easedProgress;
 				// 表示用に [-H, 0] へ正規化して適用（フリッカー防止）
 				const displayY = (((virtualY % totalHeight) + totalHeight) % totalHeight) - totalHeight;
-				reel.element.style.transform = `translateY(${displayY}px)`;
+				this.renderReel(reel, displayY);
 
 				// 追加ログ（デフォルトOFF）
-				if (this.config.debug?.frameLogs) {
+				if (frameLogs) {
 					console.log(`Reel ${index} Stop Anim: startY=${startY.toFixed(2)}px, targetY=${animTargetY.toFixed(2)}px, elapsed=${elapsed.toFixed(2)}ms, progress=${progress.toFixed(2)}, easedProgress=${easedProgress.toFixed(2)}, virtualY=${virtualY.toFixed(2)}px, displayY=${displayY.toFixed(2)}px`);
 				}
 
-				if (progress < 1) {
-					requestAnimationFrame(animateStop);
-				} else {
+				if (progress >= 1) {
 					// 最終位置は正規化した表示値で確定
 					const finalY = (((animTargetY % totalHeight) + totalHeight) % totalHeight) - totalHeight;
-					reel.element.style.transform = `translateY(${finalY}px)`;
+					this.renderReel(reel, finalY);
+					this.setReelTick(reel, null); // フレームループから外す（他に動くリールが無ければループも止まる）
+					reel.stopping = false;
 					reel.spinning = false;
 					reel.element.classList.remove('spinning'); // 回転中クラスを削除
 					// 目押しボタンの活性状態を更新（途中停止でも反映）
@@ -1433,7 +1669,8 @@ class SlotGame {
 					this.checkAllStopped();
 				}
 			};
-			requestAnimationFrame(animateStop);
+			reel.stopping = true;
+			this.setReelTick(reel, animateStop);
 
 		} else {
 			// --- 通常停止ロジックをターゲット生成に切り替え ---
@@ -1535,26 +1772,48 @@ class SlotGame {
 			this.updateManualButtonsUI();
 
 			// 全リール停止後: 当たり判定とペイアウト処理
+			// 残高・借金の状態はここで即時に確定させ（直後に次のスピンが始まっても整合する）、
+			// 表示・当たり音・勝利メッセージは最終停止フレームの描画後に回して停止の見た目を遅らせない。
 			let payout = this.evaluatePayout();
+			let repaid = 0;
+			let won = 0;
 			if (payout > 0) {
 				// 借金があればまず返済に充てる（全額返済可能な場合は残りを残高へ）
 				if (this.debt > 0) {
-					const repay = Math.min(this.debt, payout);
-					this.debt -= repay;
-					payout -= repay;
-					this.updateDebtUI();
-					console.log(`Debt repaid: ¥${repay}, remaining debt=¥${this.debt}`);
+					repaid = Math.min(this.debt, payout);
+					this.debt -= repaid;
+					payout -= repaid;
+					console.log(`Debt repaid: ¥${repaid}, remaining debt=¥${this.debt}`);
 				}
 				if (payout > 0) {
-					// サウンド: 当たり
-					try { this.soundManager?.playWin(); } catch (e) { }
-					this.balance += payout;
-					this.updateBalanceUI();
-					console.log(`Win! payout=¥${payout}, new balance=¥${this.balance}`);
-					// 勝利メッセージを表示
-					try { this.showWinMessage(payout); } catch (e) { }
+					won = payout;
+					this.balance += won;
+					console.log(`Win! payout=¥${won}, new balance=¥${this.balance}`);
 				}
 			}
+			if (repaid > 0 || won > 0) {
+				// ここは最後のリールの停止 tick（= requestAnimationFrame のコールバック内）から呼ばれるため、
+				// setTimeout で登録したタスクはこのフレームの描画後に実行される
+				setTimeout(() => this.presentSpinResult(repaid, won), 0);
+			}
+		}
+	}
+
+	/**
+	 * 確定済みのスピン結果を画面に反映します（残高/借金表示、当たり音、勝利メッセージ）。
+	 * @param {number} repaid - 借金返済に充てた額
+	 * @param {number} won - 残高に加算した額
+	 */
+	presentSpinResult(repaid, won) {
+		if (repaid > 0) this.updateDebtUI();
+		if (won > 0) {
+			this.updateBalanceUI();
+			// 描画待ちの間に次のスピンが始まっていたら演出は出さない（次の結果と紛らわしいため）
+			if (this.isSpinning) return;
+			// サウンド: 当たり
+			try { this.soundManager?.playWin(); } catch (e) { }
+			// 勝利メッセージを表示
+			try { this.showWinMessage(won); } catch (e) { }
 		}
 	}
 
@@ -1566,29 +1825,74 @@ class SlotGame {
 	evaluatePayout() {
 		// 先に各リールの top インデックスを1回ずつ計算して使い回す
 		const topIdxPerReel = this.reels.map(r => {
-			const y = this.ui.getCurrentTranslateY(r.element);
+			const y = this.getReelY(r);
 			const len = r.symbols.length;
 			return (Math.round(-y / this.config.symbolHeight) % len + len) % len;
 		});
 
-		const lines = this.getWinningLines();
+		// 停止位置の組み合わせから成立ライン倍率を引く（テーブルが無ければその場で判定）
+		const table = this.getOutcomeTable();
+		let lineMults;
+		if (table) {
+			let outcomeIndex = 0;
+			for (let r = 0; r < this.reels.length; r++) {
+				outcomeIndex = outcomeIndex * this.reels[r].symbols.length + topIdxPerReel[r];
+			}
+			lineMults = table[outcomeIndex];
+		} else {
+			lineMults = this.getLineMultipliersAt(topIdxPerReel);
+		}
+
+		// ラインごとに切り捨てて合算（掛け金が小数でも従来と同じ端数処理）
 		const bet = this.currentBet || 0;
 		let totalPayout = 0;
+		for (const mult of lineMults) totalPayout += Math.floor(bet * mult);
+		return totalPayout;
+	}
 
-		for (const line of lines) {
-			const syms = line.map((rowIdx, reelIdx) => {
-				const r = this.reels[reelIdx];
-				const len = r.symbols.length;
-				const visIdx = (topIdxPerReel[reelIdx] + rowIdx) % len;
-				return r.symbols[visIdx];
-			});
-			if (syms.every(s => s === syms[0])) {
-				const mult = this.payoutTable[syms[0]] || 0;
-				totalPayout += Math.floor(bet * mult);
-			}
+	/**
+	 * 指定した停止位置で成立するラインの配当倍率を返します。
+	 * @param {ArrayLike<number>} topIdxPerReel - 各リールの top インデックス
+	 * @returns {number[]} 成立したラインごとの倍率（外れなら空配列）
+	 */
+	getLineMultipliersAt(topIdxPerReel) {
+		const rowCount = this.ROW_NAMES.length;
+		const mults = [];
+		for (const line of this.getWinningLines()) {
+			const ids = line.map((rowIdx, reelIdx) => this.reels[reelIdx].windowIds[topIdxPerReel[reelIdx] * rowCount + rowIdx]);
+			if (ids.every(id => id === ids[0])) mults.push(this.payoutById[ids[0]]);
 		}
+		return mults;
+	}
 
-		return totalPayout;
+	/**
+	 * 全停止位置の組み合わせについて成立ライン倍率を事前計算したテーブルを返します（初回のみ構築）。
+	 * インデックスは各リールの top インデックスを混合基数で並べた値（左リールが最上位桁）です。
+	 * 3リール×21コマなら 9261 通りで、スピン結果の判定は1回の配列参照になります。
+	 * @returns {Array<number[]>|null} 組み合わせ数が OUTCOME_TABLE_MAX_SIZE を超える場合は null
+	 */
+	getOutcomeTable() {
+		if (this._outcomeTable != null) return this._outcomeTable || null;
+		const lens = this.reels.map(r => r.symbols.length);
+		const size = lens.reduce((a, b) => a * b, 1);
+		if (size > OUTCOME_TABLE_MAX_SIZE) {
+			this._outcomeTable = false; // 大きすぎる構成では都度計算にフォールバック
+			return null;
+		}
+		const table = new Array(size);
+		const noWin = Object.freeze([]); // 外れは共有の空配列で表す
+		const topIdx = new Array(lens.length).fill(0);
+		for (let k = 0; k < size; k++) {
+			const mults = this.getLineMultipliersAt(topIdx);
+			table[k] = mults.length > 0 ? mults : noWin;
+			// 右リールを最下位桁として次の組み合わせへ進める
+			for (let r = lens.length - 1; r >= 0; r--) {
+				if (++topIdx[r] < lens[r]) break;
+				topIdx[r] = 0;
+			}
+		}
+		this._outcomeTable = table;
+		return table;
 	}
 
 	/**
@@ -1631,21 +1935,33 @@ class SlotGame {
 	 * @param {number} [duration=2000] - 表示時間（ms）
 	 */
 	showWinMessage(amount, duration = 2000) {
-		const el = document.getElementById('winMessage');
+		const el = this.winMessageEl;
 		if (!el) return;
-		const amt = el.querySelector('.amount');
+		const amt = this.winMessageAmountEl;
 		if (amt) amt.textContent = `¥${this.formatCurrency(amount)}`;
 		el.classList.add('show');
+		this.winMessageShown = true;
 		// 前回のタイマーがあればクリア
 		if (this._winMsgTimer) clearTimeout(this._winMsgTimer);
 		this._winMsgTimer = setTimeout(() => this.hideWinMessage(), duration);
 	}
 
 	hideWinMessage() {
-		const el = document.getElementById('winMessage');
+		const el = this.winMessageEl;
 		if (!el) return;
-		el.classList.remove('show');
 		if (this._winMsgTimer) { clearTimeout(this._winMsgTimer); this._winMsgTimer = null; }
+		if (!this.winMessageShown) return; // 表示していなければ DOM を触らない
+		this.winMessageShown = false;
+		el.classList.remove('show');
+	}
+
+	/**
+	 * 前回スピンの結果表示（勝利メッセージ）を片付けます。
+	 * 表示中のときだけ、スタート処理の後のアイドル時間に非表示化します。
+	 */
+	clearLastResult() {
+		if (!this.winMessageShown) return;
+		scheduleIdle(() => this.hideWinMessage());
 	}
 
 	/* --------------------------
@@ -1756,40 +2072,78 @@ class SlotGame {
 	 * @returns {string} 抽選されたシンボルの文字（例: '🍒'）
 	 */
 	chooseSymbolByProbability() {
-		// 推奨: winSymbolWeights = { '7️⃣': 1.0, 'BAR': 0.5, '🍒': 0.2, ... }
-		const weights = this.config.winSymbolWeights;
-		if (weights && Object.keys(weights).length > 0) {
-			// 全リール共通に存在するシンボルのみを対象（揃えられない候補は除外）
-			const common = this.reels.reduce((acc, r) => acc.filter(sym => r.symbols.includes(sym)), Object.keys(weights));
-			const filtered = common.filter(sym => weights[sym] > 0);
-			if (filtered.length > 0) {
-				const total = filtered.reduce((s, sym) => s + weights[sym], 0);
-				let r = Math.random() * total;
-				for (const sym of filtered) {
-					r -= weights[sym];
-					if (r <= 0) return sym;
-				}
-				return filtered[filtered.length - 1];
+		const sampler = this.getWinSymbolSampler();
+		if (sampler) {
+			// 累積重みを二分探索: 乱数1回 + O(log n) 比較で選択
+			const { symbols, cumulative } = sampler;
+			const r = this.random() * cumulative[cumulative.length - 1];
+			let lo = 0;
+			let hi = cumulative.length - 1;
+			while (lo < hi) {
+				const mid = (lo + hi) >> 1;
+				if (r < cumulative[mid]) hi = mid;
+				else lo = mid + 1;
 			}
+			return symbols[lo];
 		}
 		// フォールバック: 左リールからランダム
 		const symbols = this.reels[0].symbols;
-		return symbols[Math.floor(Math.random() * symbols.length)];
+		return symbols[Math.floor(this.random() * symbols.length)];
 	}
 
 	/**
-	 * 各リールでのシンボル出現確率マップを返す。
-	 * @returns {Array<Record<string, number>>}
+	 * 当たり演出用シンボル抽選テーブル（候補シンボルと累積重み）を返します。
+	 * 候補の絞り込みと重みの合計はスピンごとに変わらないため、初回のみ構築してキャッシュします。
+	 * 注意: winSymbolWeights は構築時点の値で固定されます。実行中に変更した場合は invalidateStatsCache()
+	 *       （開発者パネルの「更新」ボタン）で破棄しないと抽選に反映されません。
+	 * @returns {{symbols: string[], cumulative: Float64Array}|null} 候補が無い場合は null
+	 */
+	getWinSymbolSampler() {
+		if (this._winSymbolSampler != null) return this._winSymbolSampler || null;
+		// 推奨: winSymbolWeights = { '7️⃣': 1.0, 'BAR': 0.5, '🍒': 0.2, ... }
+		const weights = this.config.winSymbolWeights || {};
+		// 全リール共通に存在するシンボルのみを対象（揃えられない候補は除外）
+		const common = this.reels.reduce((acc, r) => acc.filter(sym => r.symbols.includes(sym)), Object.keys(weights));
+		const symbols = common.filter(sym => weights[sym] > 0);
+		const cumulative = new Float64Array(symbols.length);
+		let total = 0;
+		symbols.forEach((sym, i) => {
+			total += weights[sym];
+			cumulative[i] = total;
+		});
+		// 候補なしも false としてキャッシュし、毎回の再構築を避ける
+		this._winSymbolSampler = symbols.length > 0 ? { symbols, cumulative } : false;
+		return this._winSymbolSampler || null;
+	}
+
+	/**
+	 * 各リールでのシンボル出現確率を返す（初回計算後はキャッシュを返す）。
+	 * @returns {Float64Array[]} probs[reelIndex][symbolId]
 	 */
 	getPerReelSymbolProbs() {
-		return this.reels.map(r => {
-			const counts = {};
-			for (const s of r.symbols) counts[s] = (counts[s] || 0) + 1;
-			const total = r.symbols.length;
-			const probs = {};
-			Object.keys(counts).forEach(k => probs[k] = counts[k] / total);
+		if (this._perReelProbCache) return this._perReelProbCache;
+		const symbolCount = this.symbolList.length;
+		this._perReelProbCache = this.reels.map(r => {
+			const probs = new Float64Array(symbolCount);
+			for (const id of r.symbolIds) probs[id] += 1;
+			const total = r.symbolIds.length;
+			for (let id = 0; id < symbolCount; id++) probs[id] /= total;
 			return probs;
 		});
+		return this._perReelProbCache;
+	}
+
+	/**
+	 * 1ライン上で全リールが同じシンボルになる確率をシンボルIDごとに返す（停止位置は一様と仮定）。
+	 * @returns {Float64Array} probs[symbolId] = product_over_reels P_r(symbolId)
+	 */
+	getLineHitProbsById() {
+		const perReelProb = this.getPerReelSymbolProbs();
+		const probs = new Float64Array(this.symbolList.length).fill(1);
+		for (const reelProbs of perReelProb) {
+			for (let id = 0; id < probs.length; id++) probs[id] *= reelProbs[id];
+		}
+		return probs;
 	}
 
 	/**
@@ -1801,10 +2155,9 @@ class SlotGame {
 	calculateStopDuration(distance) {
 		// 現在のモードに応じた速度（px/frame）
 		const speed = this.isAutoMode ? this.config.autoSpeed : this.config.manualSpeed;
-		// rAF 60fps を想定して px/frame → px/ms に換算し、イージング導関数(0)でスケール
-		const msPerFrame = 1000 / 60;
+		// 60fps 換算の px/frame → px/ms に換算し、イージング導関数(0)でスケール
 		const deriv0 = this.getStopEasingDerivative0();
-		let time = (distance / speed) * msPerFrame * deriv0;
+		let time = (distance / speed) * REFERENCE_FRAME_MS * deriv0;
 		// 自動停止時は一定以上の減速時間を確保して体感差を抑える
 		if (this.isAutoMode && typeof this.config.stopBaseDurationMs === 'number') {
 			time = Math.max(time, this.config.stopBaseDurationMs);